@@ -149,9 +149,9 @@ class RDLCompiler:
         if name in self.env.property_rules.rdl_properties:
             raise ValueError("name '%s' conflicts with existing built-in RDL property")
 
-        udp = BuiltinUserProperty(self.env, name, valid_components, (valid_type,), default)
+        udp = BuiltinUserProperty(name, valid_components, (valid_type,), default)
 
-        self.env.property_rules.user_properties[udp.name] = udp
+        self.env.property_rules._add_udp(udp)
 
 
     def list_udps(self) -> List[str]:
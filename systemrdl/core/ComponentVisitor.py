@@ -19,6 +19,7 @@ from .. import rdltypes
 if TYPE_CHECKING:
     from typing import Type, Union
     from ..compiler import RDLCompiler
+    from . import properties
     from antlr4.Token import CommonToken
     from antlr4 import ParserRuleContext
 
@@ -763,10 +764,10 @@ class ComponentVisitor(BaseVisitor):
                     "Unrecognized property '%s'" % prop_name,
                     prop_src_ref
                 )
-            rule.assign_value(self.component, prop_rhs, prop_src_ref)
+            rule.assign_value(self.compiler.env, self.component, prop_rhs, prop_src_ref)
 
         # Apply locally-assigned properties
-        mutex_bins = {} # type: Dict[str, str]
+        mutex_bins = {} # type: Dict[properties.MutexGroup, str]
         for prop_name, (prop_src_ref, prop_rhs) in self.property_dict.items():
             rule = self.compiler.env.property_rules.lookup_property(prop_name)
             if rule is None:
@@ -789,7 +790,7 @@ class ComponentVisitor(BaseVisitor):
                     mutex_bins[rule.mutex_group] = prop_name
 
             # Apply property
-            rule.assign_value(self.component, prop_rhs, prop_src_ref)
+            rule.assign_value(self.compiler.env, self.component, prop_rhs, prop_src_ref)
 
         # Clear out pending assignments now that they have been resolved
         self.property_dict = {}
@@ -797,7 +798,7 @@ class ComponentVisitor(BaseVisitor):
     def apply_dynamic_properties(self) -> None:
 
         for target_inst, target_inst_dict in self.dynamic_property_dict.items():
-            mutex_bins = {} # type: Dict[str, str]
+            mutex_bins = {} # type: Dict[properties.MutexGroup, str]
             for prop_name, (prop_src_ref, prop_rhs) in target_inst_dict.items():
                 rule = self.compiler.env.property_rules.lookup_property(prop_name)
                 if rule is None:
@@ -827,7 +828,7 @@ class ComponentVisitor(BaseVisitor):
                         mutex_bins[rule.mutex_group] = prop_name
 
                 # Apply property
-                rule.assign_value(target_inst, prop_rhs, prop_src_ref)
+                rule.assign_value(self.compiler.env, target_inst, prop_rhs, prop_src_ref)
 
         # Clear out pending assignments now that they have been resolved
         self.dynamic_property_dict = {}
@@ -91,7 +91,7 @@ class UDPVisitor(BaseVisitor):
 
         # Create and register the new property rule
         udp = properties.UserProperty(
-            self.compiler.env, udp_name,
+            udp_name,
             self._bindable_to, self._valid_types, self._default,
             self._constr_componentwidth
         )
@@ -1,4 +1,15 @@
-from typing import Any, Set, Type, Iterable, TYPE_CHECKING, Optional, Dict, List, Union
+import enum
+import functools
+import sys
+from collections import deque
+
+from typing import Any, Set, FrozenSet, Type, Iterable, TYPE_CHECKING, Optional, Dict, Tuple, Union
+
+try:
+    from typing import final
+except ImportError: # pragma: no cover - Python < 3.8
+    def final(f: 'T') -> 'T':
+        return f
 
 from .. import component as comp
 from .. import node as m_node
@@ -12,21 +23,116 @@ if TYPE_CHECKING:
 
     T = TypeVar('T')
 
-def get_all_subclasses(cls: Type['T']) -> List[Type['T']]:
-    return cls.__subclasses__() + [
-        g for s in cls.__subclasses__()
-        for g in get_all_subclasses(s)
-    ]
+@functools.lru_cache(maxsize=None)
+def _collect_subclasses(cls: Type['T']) -> Tuple[Type['T'], ...]:
+    # The class hierarchy is static after import, so the traversal result is
+    # memoized per root class
+    subclasses = []
+    queue = deque(cls.__subclasses__())
+    while queue:
+        subcls = queue.popleft()
+        subclasses.append(subcls)
+        queue.extend(subcls.__subclasses__())
+    return tuple(subclasses)
+
+
+# Fast-path dispatch for the assignment type of common directly-assigned
+# values. Values of these types are never ASTNode expressions or user enum
+# classes, so a single dict lookup can replace the isinstance branch chain in
+# PropertyRule.assign_value
+_DIRECT_ASSIGN_TYPE_MAP = {
+    t: t for t in (
+        bool, int, str,
+        rdltypes.AccessType, rdltypes.OnReadType, rdltypes.OnWriteType,
+        rdltypes.AddressingType, rdltypes.InterruptType, rdltypes.PrecedenceType,
+    )
+}
+
+
+# Assignment types that are known ahead of time and can therefore have their
+# castability against a rule's valid_types precomputed.
+# Anything else (user enum/struct classes, property reference classes,
+# array placeholders) is resolved the slow way on demand.
+_CANDIDATE_ASSIGN_TYPES = (
+    bool, int, str,
+    rdltypes.UserEnum,
+    rdltypes.AccessType, rdltypes.OnReadType, rdltypes.OnWriteType,
+    rdltypes.AddressingType, rdltypes.InterruptType, rdltypes.PrecedenceType,
+    rdltypes.PropertyReference,
+    comp.Addrmap, comp.Regfile, comp.Reg, comp.Field, comp.Mem, comp.Signal,
+)
+
+class MutexGroup(enum.IntEnum):
+    """
+    Tags for groups of properties that are mutually exclusive within a
+    component. Members compare as small ints, which is cheaper than the
+    one-character string tags previously used as dict keys.
+    Letter members follow the grouping tags used by the SystemRDL spec.
+    """
+    # Values are explicit rather than enum.auto(), which requires Python 3.6
+    A = 1
+    B = 2
+    C = 3
+    D = 4
+    E = 5
+    F = 6
+    G = 7
+    I = 8
+    J = 9
+    K = 10
+    L = 11
+    M = 12
+    N = 13
+    O = 14
+    P = 15
+    Q = 16
+    R = 17
+    INCRTHRESHOLD_ALIAS = 18
+    INCRSATURATE_ALIAS = 19
+
+
+# Sentinel for assignment types absent from a rule's precomputed cast map
+_CAST_UNKNOWN = object()
+
+# Sentinel for absent dict entries where None is a legal value
+_MISSING = object()
+
+def _build_cast_map(valid_types: Iterable[Any]) -> Dict[Any, Any]:
+    """
+    Precompute, for each candidate assignment type, whether it is directly
+    compatible with valid_types (mapped to None) or needs an assignment cast
+    (mapped to the preferred cast target). Incompatible candidates are left
+    out of the map.
+    """
+    cast_map = {} # type: Dict[Any, Any]
+    for assign_type in _CANDIDATE_ASSIGN_TYPES:
+        for valid_type in valid_types:
+            if assign_type == valid_type:
+                cast_map[assign_type] = None
+                break
+        else:
+            for valid_type in valid_types:
+                if ast.is_castable(assign_type, valid_type):
+                    cast_map[assign_type] = valid_type
+                    break
+    return cast_map
 
 #===============================================================================
 # Base property
 #===============================================================================
 class PropertyRule:
+    # Rules are stateless singletons - all configuration is class-level, so
+    # instances do not need a __dict__.
+    # (UserProperty re-enables one by not declaring __slots__)
+    __slots__ = ()
+
     # Set of components this property can be bound to
-    bindable_to = set() # type: Set[Type[comp.Component]]
+    # Stored as a frozenset so the per-assignment membership test is a plain
+    # hash lookup on an immutable container
+    bindable_to = frozenset() # type: FrozenSet[Type[comp.Component]]
 
-    # List of valid assignment types. In order of cast preference
-    valid_types = tuple() # type: Iterable[Any]
+    # Valid assignment types, in order of cast preference
+    valid_types = tuple() # type: Tuple[Any, ...]
 
     # Default value if not assigned
     default = None # type: Any
@@ -34,12 +140,41 @@ class PropertyRule:
     # Whether dynamic assignments are allowed to be made to this property
     dyn_assign_allowed= True # type: bool
 
-    # Group string in which this property is mutually exclusive
-    mutex_group = None # type: Optional[str]
+    # Group in which this property is mutually exclusive
+    mutex_group = None # type: Optional[MutexGroup]
 
+    # Property name of the equivalent opposite, for rules that come in bool
+    # pairs (see PropertyRuleBoolPair). Empty for everything else.
+    # Declared here so the module-bottom interning pass is soundly typed
+    opposite_property = "" # type: str
 
-    def __init__(self, env: 'RDLEnvironment'):
-        self.env = env
+    # Property name. Derived once at import via get_name_cls()
+    _name = "" # type: str
+
+    # Precomputed castability of candidate assignment types against
+    # valid_types. Populated at import
+    _cast_map = {} # type: Dict[Any, Any]
+
+    # Whether this rule's get_default() does anything beyond returning the
+    # static default. If not, query paths can skip the method call entirely
+    _has_custom_default = False # type: bool
+
+    # Names of the other properties in this rule's mutex group, precomputed
+    # at module bottom once all groups are known. Empty for ungrouped rules
+    _mutex_peers = () # type: Tuple[str, ...]
+
+    # Name of the property this rule mirrors its assignments onto, for the
+    # counter alias rules (see CounterAliasProperty). Empty for everything
+    # else. Declared here so the module-bottom interning pass is soundly typed
+    _alias_target = "" # type: str
+
+    # Whether this rule's validate() actually performs checks.
+    # The validation pass skips the call for rules that use the no-op base
+    _has_validate = False # type: bool
+
+    # Registry of all built-in property rule classes, keyed by property name.
+    # Populated by the class bookkeeping pass at module bottom
+    _registry = {} # type: Dict[str, Type['PropertyRule']]
 
 
     @classmethod
@@ -48,10 +183,10 @@ class PropertyRule:
 
 
     def get_name(self) -> str:
-        return self.get_name_cls()
+        return self._name
 
 
-    def assign_value(self, comp_def: comp.Component, value: Any, src_ref: 'SourceRefBase') -> None:
+    def assign_value(self, env: 'RDLEnvironment', comp_def: comp.Component, value: Any, src_ref: 'SourceRefBase') -> None:
         """
         Used by the compiler for either local or dynamic prop assignments
         This does the following:
@@ -63,9 +198,9 @@ class PropertyRule:
 
         # Check if property is allowed in this component
         if type(comp_def) not in self.bindable_to:
-            self.env.msg.fatal(
+            env.msg.fatal(
                 "The property '%s' is not valid for '%s' components"
-                % (self.get_name(), type(comp_def).__name__.lower()),
+                % (self._name, type(comp_def).__name__.lower()),
                 src_ref
             )
 
@@ -78,48 +213,63 @@ class PropertyRule:
         # Contents of value can be:
         #   - An expression (instance of an ASTNode subclass)
         #   - Direct assignment of a type-compatible value
-        if isinstance(value, ast.ASTNode):
-            # Predict expected type after value would get evaluated
-            assign_type = value.predict_type()
-        elif rdltypes.is_user_enum(value):
-            # Value is a user enum type derived from UserEnum.
-            # Mark it as such
-            assign_type = rdltypes.UserEnum
-        else:
-            # Value is already evaluated
-            assign_type = type(value)
-
-        # First check if the value's type is already directly compatible
-        for valid_type in self.valid_types:
-            if assign_type == valid_type:
-                break
-        else:
-            # otherwise, cast to the first compatible type
+        assign_type = _DIRECT_ASSIGN_TYPE_MAP.get(type(value)) # type: Any
+        if assign_type is None:
+            if isinstance(value, ast.ASTNode):
+                # Predict expected type after value would get evaluated
+                assign_type = value.predict_type()
+            elif rdltypes.is_user_enum(value):
+                # Value is a user enum type derived from UserEnum.
+                # Mark it as such
+                assign_type = rdltypes.UserEnum
+            else:
+                # Value is already evaluated
+                assign_type = type(value)
+
+        # Check compatibility with this rule's valid types, and whether an
+        # assignment cast is needed. The answer for common assignment types is
+        # already precomputed in the class's cast map
+        try:
+            cast_to = self._cast_map.get(assign_type, _CAST_UNKNOWN)
+        except TypeError:
+            # Unhashable type identifiers (eg. ArrayPlaceholder instances)
+            # cannot be cast map keys. Resolve them the slow way
+            cast_to = _CAST_UNKNOWN
+
+        if cast_to is _CAST_UNKNOWN:
+            # First check if the value's type is already directly compatible
             for valid_type in self.valid_types:
-                if ast.is_castable(assign_type, valid_type):
-                    if isinstance(value, ast.ASTNode):
-                        # Found a type-compatible match. (first match is best match)
-                        # Wrap the expression with an explicit assignment cast
-                        value = ast.AssignmentCast(self.env, src_ref, value, valid_type)
+                if assign_type == valid_type:
+                    cast_to = None
                     break
             else:
-                self.env.msg.fatal(
-                    "Incompatible assignment to property '%s'" % self.get_name(),
-                    src_ref
-                )
+                # otherwise, cast to the first compatible type
+                # (first match is best match)
+                for valid_type in self.valid_types:
+                    if ast.is_castable(assign_type, valid_type):
+                        cast_to = valid_type
+                        break
+                else:
+                    env.msg.fatal(
+                        "Incompatible assignment to property '%s'" % self._name,
+                        src_ref
+                    )
+
+        if (cast_to is not None) and isinstance(value, ast.ASTNode):
+            # Wrap the expression with an explicit assignment cast
+            value = ast.AssignmentCast(env, src_ref, value, cast_to)
 
         # If the property belongs to a mutex group, wipe out any of its
         # counterpart properties
-        if self.mutex_group is not None:
-            for prop_name in MUTEX_PROP_GROUPS[self.mutex_group]:
-                if prop_name in comp_def.properties:
-                    del comp_def.properties[prop_name]
+        for prop_name in self._mutex_peers:
+            if prop_name in comp_def.properties:
+                del comp_def.properties[prop_name]
 
         # Store the property
-        comp_def.properties[self.get_name()] = value
+        comp_def.properties[self._name] = value
 
         if src_ref is not None:
-            comp_def.property_src_ref[self.get_name()] = src_ref
+            comp_def.property_src_ref[self._name] = src_ref
 
 
     def get_default(self, node: m_node.Node) -> Any:
@@ -149,25 +299,25 @@ class PropertyRule:
         """
         if isinstance(value, m_node.VectorNode):
             if node.width != value.width:
-                self.env.msg.error(
+                node.env.msg.error(
                     "%s '%s' references %s '%s''s value but they are not the same width (%d != %d)"
                     % (
                         type(node.inst).__name__.lower(), node.inst_name,
                         type(value.inst).__name__.lower(), value.inst_name,
                         node.width, value.width
                     ),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
         elif isinstance(value, rdltypes.PropertyReference) and value.width is not None:
             if node.width != value.width:
-                self.env.msg.error(
+                node.env.msg.error(
                     "%s '%s' references property '%s->%s' but they are not the same width (%d != %d)"
                     % (
                         type(node.inst).__name__.lower(), node.inst_name,
                         value.node.inst_name, value.name,
                         node.width, value.width
                     ),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
 
@@ -178,23 +328,23 @@ class PropertyRule:
         """
         if isinstance(value, m_node.VectorNode):
             if value.width != 1:
-                self.env.msg.error(
+                node.env.msg.error(
                     "%s '%s' references %s '%s' but it's width is not 1"
                     % (
                         type(node.inst).__name__.lower(), node.inst_name,
                         type(value.inst).__name__.lower(), value.inst_name
                     ),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
         elif isinstance(value, rdltypes.PropertyReference) and value.width is not None:
             if value.width != 1:
-                self.env.msg.error(
+                node.env.msg.error(
                     "%s '%s' references property '%s->%s' but it's width is not 1"
                     % (
                         type(node.inst).__name__.lower(), node.inst_name,
                         value.node.inst_name, value.name,
                     ),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
 
@@ -205,23 +355,23 @@ class PropertyRule:
         """
         if isinstance(value, m_node.Node):
             if not value.get_property('ispresent'):
-                self.env.msg.error(
+                node.env.msg.error(
                     "%s '%s' references %s '%s' but it is not present (ispresent=false)"
                     % (
                         type(node.inst).__name__.lower(), node.inst_name,
                         type(value.inst).__name__.lower(), value.inst_name
                     ),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
         elif isinstance(value, rdltypes.PropertyReference):
             if not value.node.get_property('ispresent'):
-                self.env.msg.error(
+                node.env.msg.error(
                     "%s '%s' references '%s->%s' but it is not present (ispresent=false)"
                     % (
                         type(node.inst).__name__.lower(), node.inst_name,
                         value.node.inst_name, value.name
                     ),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
     def _validate_width_eq_or_smaller(self, node: m_node.VectorNode, value: Any) -> None:
@@ -234,31 +384,67 @@ class PropertyRule:
         """
         if isinstance(value, int):
             if node.width < value.bit_length():
-                self.env.msg.error(
+                node.env.msg.error(
                     "A counter's %s cannot reference a value wider than the counter itself."
-                    % (self.get_name()),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    % (self._name),
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
         elif isinstance(value, m_node.VectorNode):
             if node.width < value.width:
-                self.env.msg.error(
+                node.env.msg.error(
                     "A counter's %s cannot reference a value wider than the counter itself."
-                    % (self.get_name()),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    % (self._name),
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
         elif isinstance(value, rdltypes.PropertyReference) and value.width is not None:
             if node.width < value.width:
-                self.env.msg.error(
+                node.env.msg.error(
                     "A counter's %s cannot reference a value wider than the counter itself."
-                    % (self.get_name()),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    % (self._name),
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
 
 #===============================================================================
-class PropertyRuleBoolPair(PropertyRule):
-    # Property name of the equivalent opposite
-    opposite_property = ""
+class PropertyRuleBool(PropertyRule):
+    """
+    Specialization for the many properties that only accept a boolean.
+    Plain True/False assignments (by far the most common case) skip the
+    generic type-dispatch pipeline in PropertyRule.assign_value()
+    """
+    __slots__ = ()
+
+    valid_types = (bool,)
+
+    def assign_value(self, env: 'RDLEnvironment', comp_def: comp.Component, value: Any, src_ref: 'SourceRefBase') -> None:
+        if value is not None and value is not True and value is not False:
+            # Expressions and other value kinds still take the generic path
+            super().assign_value(env, comp_def, value, src_ref)
+            return
+
+        if type(comp_def) not in self.bindable_to:
+            env.msg.fatal(
+                "The property '%s' is not valid for '%s' components"
+                % (self._name, type(comp_def).__name__.lower()),
+                src_ref
+            )
+
+        # Assignment with no rhs implies a True value
+        if value is None:
+            value = True
+
+        for prop_name in self._mutex_peers:
+            if prop_name in comp_def.properties:
+                del comp_def.properties[prop_name]
+
+        comp_def.properties[self._name] = value
+
+        if src_ref is not None:
+            comp_def.property_src_ref[self._name] = src_ref
+
+
+class PropertyRuleBoolPair(PropertyRuleBool):
+    __slots__ = ()
 
     def get_default(self, node: m_node.Node) -> bool:
         """
@@ -266,10 +452,11 @@ class PropertyRuleBoolPair(PropertyRule):
         default
         """
         # Check for explicit assignment to avoid infinite loop via get_default()
-        if self.opposite_property in node.inst.properties:
-            return not node.inst.properties[self.opposite_property]
-        else:
+        opposite = node.inst.properties.get(self.opposite_property, _MISSING)
+        if opposite is _MISSING:
             return self.default
+        else:
+            return not opposite
 
 #===============================================================================
 # General Properties
@@ -279,7 +466,7 @@ class Prop_name(PropertyRule):
     Specifies a more descriptive name
     (5.2.1)
     """
-    bindable_to = {comp.Addrmap, comp.Field, comp.Mem, comp.Reg, comp.Regfile, comp.Signal}
+    bindable_to = frozenset({comp.Addrmap, comp.Field, comp.Mem, comp.Reg, comp.Regfile, comp.Signal})
     valid_types = (str,)
     default = ""
     dyn_assign_allowed = True
@@ -298,7 +485,7 @@ class Prop_desc(PropertyRule):
     Describes the component’s purpose.
     (5.2.1)
     """
-    bindable_to = {comp.Addrmap, comp.Field, comp.Mem, comp.Reg, comp.Regfile, comp.Signal}
+    bindable_to = frozenset({comp.Addrmap, comp.Field, comp.Mem, comp.Reg, comp.Regfile, comp.Signal})
     valid_types = (str,)
     default = None
     dyn_assign_allowed = True
@@ -311,21 +498,21 @@ class Prop_dontcompare(PropertyRule):
     against expected results.
     (5.2.2)
     """
-    bindable_to = {comp.Addrmap, comp.Reg, comp.Regfile, comp.Field}
+    bindable_to = frozenset({comp.Addrmap, comp.Reg, comp.Regfile, comp.Field})
     valid_types = (int, bool,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "O"
+    mutex_group = MutexGroup.O
 
-    def assign_value(self, comp_def: comp.Component, value: Any, src_ref: 'SourceRefBase') -> None:
-        super().assign_value(comp_def, value, src_ref)
+    def assign_value(self, env: 'RDLEnvironment', comp_def: comp.Component, value: Any, src_ref: 'SourceRefBase') -> None:
+        super().assign_value(env, comp_def, value, src_ref)
 
         # int type only makes sense if assigned to a field (since it is a bitmask)
         # If assigned to any other components, exclusively cast it to a boolean
         if not isinstance(comp_def, comp.Field):
-            value = comp_def.properties[self.get_name()]
-            value = ast.AssignmentCast(self.env, src_ref, value, bool)
-            comp_def.properties[self.get_name()] = value
+            value = comp_def.properties[self._name]
+            value = ast.AssignmentCast(env, src_ref, value, bool)
+            comp_def.properties[self._name] = value
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         donttest = node.get_property('donttest')
@@ -335,10 +522,10 @@ class Prop_dontcompare(PropertyRule):
             # as the field
             if isinstance(value, int):
                 if value >= (1 << node.width):
-                    self.env.msg.error(
+                    node.env.msg.error(
                         "Bit mask (%d) of property 'dontcompare' exceeds width (%d) of field '%s'"
                         % (value, node.width, node.inst_name),
-                        node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                        node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                     )
 
             # Normalize values to masks
@@ -359,7 +546,7 @@ class Prop_dontcompare(PropertyRule):
             # shall be zero (0) for a particular component
             # (i.e., donttest & dontcompare = 0)
             if value & donttest:
-                self.env.msg.error(
+                node.env.msg.error(
                     "A field's bit cannot have both 'dontcompare' and 'donttest' properties enabled",
                     node.inst.inst_src_ref
                 )
@@ -372,7 +559,7 @@ class Prop_dontcompare(PropertyRule):
             # 5.2.2.1-b: can also be applied to reg, regfile, and addrmap
             # components, but only as a boolean
             if not isinstance(value, bool):
-                self.env.msg.error(
+                node.env.msg.error(
                     "Property 'dontcompare' expects a boolean for non-field types. Got an integer in '%s'"
                     % (node.inst_name),
                     node.inst.inst_src_ref
@@ -380,7 +567,7 @@ class Prop_dontcompare(PropertyRule):
 
             # 5.2.2.1-c.1: dontcompare/donttest cannot both be set to true
             if donttest and value:
-                self.env.msg.error(
+                node.env.msg.error(
                     "Properties dontcompare/donttest cannot both be set to true in '%s'"
                     % (node.inst_name),
                     node.inst.inst_src_ref
@@ -392,21 +579,21 @@ class Prop_donttest(PropertyRule):
     Indicates the component is not included in structural testing.
     (5.2.2)
     """
-    bindable_to = {comp.Addrmap, comp.Reg, comp.Regfile, comp.Field}
+    bindable_to = frozenset({comp.Addrmap, comp.Reg, comp.Regfile, comp.Field})
     valid_types = (int, bool,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "O"
+    mutex_group = MutexGroup.O
 
-    def assign_value(self, comp_def: comp.Component, value: Any, src_ref: 'SourceRefBase') -> None:
-        super().assign_value(comp_def, value, src_ref)
+    def assign_value(self, env: 'RDLEnvironment', comp_def: comp.Component, value: Any, src_ref: 'SourceRefBase') -> None:
+        super().assign_value(env, comp_def, value, src_ref)
 
         # int type only makes sense if assigned to a field (since it is a bitmask)
         # If assigned to any other components, exclusively cast it to a boolean
         if not isinstance(comp_def, comp.Field):
-            value = comp_def.properties[self.get_name()]
-            value = ast.AssignmentCast(self.env, src_ref, value, bool)
-            comp_def.properties[self.get_name()] = value
+            value = comp_def.properties[self._name]
+            value = ast.AssignmentCast(env, src_ref, value, bool)
+            comp_def.properties[self._name] = value
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         if isinstance(node, m_node.FieldNode):
@@ -414,10 +601,10 @@ class Prop_donttest(PropertyRule):
             # as the field
             if isinstance(value, int):
                 if value >= (1 << node.width):
-                    self.env.msg.error(
+                    node.env.msg.error(
                         "Bit mask (%d) of property 'donttest' exceeds width (%d) of field '%s'"
                         % (value, node.width, node.inst_name),
-                        node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                        node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                     )
         else:
             # A boolean may end up cast as an int. Normalize 0 or 1 to boolean
@@ -427,28 +614,28 @@ class Prop_donttest(PropertyRule):
             # 5.2.2.1-b: can also be applied to reg, regfile, and addrmap
             # components, but only as a boolean
             if not isinstance(value, bool):
-                self.env.msg.error(
+                node.env.msg.error(
                     "Property 'donttest' expects a boolean for non-field types. Got an integer in '%s'"
                     % (node.inst_name),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
 
-class Prop_ispresent(PropertyRule):
+class Prop_ispresent(PropertyRuleBool):
     """
     Setting ispresent to false causes the given component instance to be removed
     from the final specification.
     (5.3)
     """
-    bindable_to = {comp.Addrmap, comp.Field, comp.Mem, comp.Reg, comp.Regfile, comp.Signal}
+    bindable_to = frozenset({comp.Addrmap, comp.Field, comp.Mem, comp.Reg, comp.Regfile, comp.Signal})
     valid_types = (bool,)
     default = True
     dyn_assign_allowed = True
     mutex_group = None
 
 
-class Prop_errextbus(PropertyRule):
-    bindable_to = {comp.Addrmap, comp.Reg, comp.Regfile}
+class Prop_errextbus(PropertyRuleBool):
+    bindable_to = frozenset({comp.Addrmap, comp.Reg, comp.Regfile})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = False
@@ -457,7 +644,7 @@ class Prop_errextbus(PropertyRule):
     def validate(self, node: m_node.Node, value: Any) -> None:
         # 10.6.1-h: errextbus is only valid for external registers
         if (node.inst.external is False) and (value is True):
-            self.env.msg.error(
+            node.env.msg.error(
                 "The 'errextbus' property is set to 'true', but instance '%s' is not external"
                 % (node.inst_name),
                 node.inst.inst_src_ref
@@ -465,7 +652,7 @@ class Prop_errextbus(PropertyRule):
 
 
 class Prop_hdl_path(PropertyRule):
-    bindable_to = {comp.Addrmap, comp.Reg, comp.Regfile}
+    bindable_to = frozenset({comp.Addrmap, comp.Reg, comp.Regfile})
     valid_types = (str,)
     default = None
     dyn_assign_allowed = True
@@ -473,7 +660,7 @@ class Prop_hdl_path(PropertyRule):
 
 
 class Prop_hdl_path_gate(PropertyRule):
-    bindable_to = {comp.Addrmap, comp.Reg, comp.Regfile}
+    bindable_to = frozenset({comp.Addrmap, comp.Reg, comp.Regfile})
     valid_types = (str,)
     default = None
     dyn_assign_allowed = True
@@ -481,7 +668,7 @@ class Prop_hdl_path_gate(PropertyRule):
 
 
 class Prop_hdl_path_gate_slice(PropertyRule):
-    bindable_to = {comp.Field, comp.Mem}
+    bindable_to = frozenset({comp.Field, comp.Mem})
     valid_types = (rdltypes.ArrayPlaceholder(str),)
     default = None
     dyn_assign_allowed = True
@@ -489,7 +676,7 @@ class Prop_hdl_path_gate_slice(PropertyRule):
 
 
 class Prop_hdl_path_slice(PropertyRule):
-    bindable_to = {comp.Field, comp.Mem}
+    bindable_to = frozenset({comp.Field, comp.Mem})
     valid_types = (rdltypes.ArrayPlaceholder(str),)
     default = None
     dyn_assign_allowed = True
@@ -504,7 +691,7 @@ class Prop_signalwidth(PropertyRule):
     Width of the signal.
     (8.2)
     """
-    bindable_to = {comp.Signal}
+    bindable_to = frozenset({comp.Signal})
     valid_types = (int,)
     default = None
     dyn_assign_allowed = False
@@ -523,11 +710,11 @@ class Prop_sync(PropertyRuleBoolPair):
     Signal is synchronous to the clock of the component.
     (8.2)
     """
-    bindable_to = {comp.Signal}
+    bindable_to = frozenset({comp.Signal})
     valid_types = (bool,)
     default = True
     dyn_assign_allowed = True
-    mutex_group = "N"
+    mutex_group = MutexGroup.N
 
     opposite_property = "async"
 
@@ -537,23 +724,23 @@ class Prop_async(PropertyRuleBoolPair):
     Signal is asynchronous to the clock of the component.
     (8.2)
     """
-    bindable_to = {comp.Signal}
+    bindable_to = frozenset({comp.Signal})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "N"
+    mutex_group = MutexGroup.N
 
     opposite_property = "sync"
 
 
-class Prop_cpuif_reset(PropertyRule):
+class Prop_cpuif_reset(PropertyRuleBool):
     """
     Default signal to use for resetting the software interface logic. If
     cpuif_reset is not defined, this reverts to the default reset signal. This
     parameter only controls the CPU interface of a generated slave.
     (8.2)
     """
-    bindable_to = {comp.Signal}
+    bindable_to = frozenset({comp.Signal})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
@@ -562,21 +749,21 @@ class Prop_cpuif_reset(PropertyRule):
     def validate(self, node: m_node.Node, value: Any) -> None:
         if value is True:
             if not node.get_property('activehigh') and not node.get_property('activelow'):
-                self.env.msg.error(
+                node.env.msg.error(
                     "Signal '%s' sets the 'cpuif_reset' property but does not specify whether it is activehigh/activelow"
                     % (node.inst_name),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
 
 
-class Prop_field_reset(PropertyRule):
+class Prop_field_reset(PropertyRuleBool):
     """
     Default signal to use for resetting field implementations. If field_reset
     is not defined, this reverts to the default reset signal.
     (8.2)
     """
-    bindable_to = {comp.Signal}
+    bindable_to = frozenset({comp.Signal})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
@@ -585,35 +772,35 @@ class Prop_field_reset(PropertyRule):
     def validate(self, node: m_node.Node, value: Any) -> None:
         if value is True:
             if not node.get_property('activehigh') and not node.get_property('activelow'):
-                self.env.msg.error(
+                node.env.msg.error(
                     "Signal '%s' sets the 'field_reset' property but does not specify whether it is activehigh/activelow"
                     % (node.inst_name),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
 
-class Prop_activelow(PropertyRule):
+class Prop_activelow(PropertyRuleBool):
     """
     Signal is active low (state of 0 means ON).
     (8.2)
     """
-    bindable_to = {comp.Signal}
+    bindable_to = frozenset({comp.Signal})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "A"
+    mutex_group = MutexGroup.A
 
 
-class Prop_activehigh(PropertyRule):
+class Prop_activehigh(PropertyRuleBool):
     """
     Signal is active high (state of 1 means ON).
     (8.2)
     """
-    bindable_to = {comp.Signal}
+    bindable_to = frozenset({comp.Signal})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "A"
+    mutex_group = MutexGroup.A
 
 #===============================================================================
 # Field Properties
@@ -627,7 +814,7 @@ class Prop_hw(PropertyRule):
     Design’s ability to sample/update a field.
     (9.4)
     """
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (rdltypes.AccessType,)
     default = rdltypes.AccessType.rw
     dyn_assign_allowed = False
@@ -639,7 +826,7 @@ class Prop_sw(PropertyRule):
     Programmer’s ability to read/write a field.
     (9.4)
     """
-    bindable_to = {comp.Field, comp.Mem}
+    bindable_to = frozenset({comp.Field, comp.Mem})
     valid_types = (rdltypes.AccessType,)
     default = rdltypes.AccessType.rw
     dyn_assign_allowed = True
@@ -653,7 +840,7 @@ class Prop_next(PropertyRule):
     The next value of the field; the D-input for flip-flops.
     (9.5)
     """
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (comp.Field, comp.Signal, rdltypes.PropertyReference,)
     default = None
     dyn_assign_allowed = True
@@ -669,10 +856,10 @@ class Prop_next(PropertyRule):
             ref_node = value
 
         if node.get_path() == ref_node.get_path():
-            self.env.msg.error(
+            node.env.msg.error(
                 "Field '%s' cannot reference itself in next property"
                 % (node.inst_name),
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
         self._validate_ref_width(node, value)
@@ -681,9 +868,9 @@ class Prop_next(PropertyRule):
         # Field shall be hardware writable
         # Example in 17.2.8 makes a passing comment that suggests this is a requirement.
         if not node.is_hw_writable:
-            self.env.msg.error(
+            node.env.msg.error(
                 "Use of the 'next' property requires the field to be hardware-writable.",
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
 
@@ -692,7 +879,7 @@ class Prop_reset(PropertyRule):
     The reset value for the field when resetsignal is asserted.
     (9.5)
     """
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (int, comp.Field, comp.Signal, rdltypes.PropertyReference,)
     default = None
     dyn_assign_allowed = True
@@ -700,21 +887,23 @@ class Prop_reset(PropertyRule):
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         assert isinstance(node, m_node.FieldNode)
+        inst = node.inst
         if isinstance(value, int):
             # 9.5.1-c: The reset value cannot be larger than can fit in the field
-            if value >= (1 << node.width):
-                self.env.msg.error(
+            width = node.width
+            if value >= (1 << width):
+                node.env.msg.error(
                     "The reset value (%d) of field '%s' cannot fit within it's width (%d)"
-                    % (value, node.inst_name, node.width),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    % (value, inst.inst_name, width),
+                    inst.property_src_ref.get(self._name, inst.inst_src_ref)
                 )
         elif isinstance(value, m_node.FieldNode):
             # 9.5.1-e: reset cannot be self-referencing
             if node.get_path() == value.get_path():
-                self.env.msg.error(
+                node.env.msg.error(
                     "Field '%s' cannot reference itself in reset property"
-                    % (node.inst_name),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    % (inst.inst_name),
+                    inst.property_src_ref.get(self._name, inst.inst_src_ref)
                 )
         elif isinstance(value, (m_node.SignalNode, rdltypes.PropertyReference)):
             pass
@@ -733,7 +922,7 @@ class Prop_resetsignal(PropertyRule):
     Reference to the signal used to reset the field
     (9.5)
     """
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (comp.Signal,)
     default = None
     dyn_assign_allowed = True
@@ -745,10 +934,10 @@ class Prop_resetsignal(PropertyRule):
         self._validate_ref_is_present(node, value)
 
         if not value.get_property('activehigh') and not value.get_property('activelow'):
-            self.env.msg.error(
+            node.env.msg.error(
                 "Signal '%s' referenced in 'resetsignal' does not specify whether it is activehigh/activelow"
                 % (value.inst_name),
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
     def get_default(self, node: m_node.Node) -> Optional[m_node.SignalNode]:
@@ -769,16 +958,16 @@ class Prop_resetsignal(PropertyRule):
 # Software access properties
 #-------------------------------------------------------------------------------
 
-class Prop_rclr(PropertyRule):
+class Prop_rclr(PropertyRuleBool):
     """
     Clear on read (field = 0).
     (9.6)6
     """
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "P"
+    mutex_group = MutexGroup.P
 
     def get_default(self, node: m_node.Node) -> bool:
         """
@@ -793,23 +982,23 @@ class Prop_rclr(PropertyRule):
     def validate(self, node: m_node.Node, value: Any) -> None:
         assert isinstance(node, m_node.FieldNode)
         if value is True and not node.is_sw_readable:
-            self.env.msg.error(
+            node.env.msg.error(
                 "Field '%s' sets the 'rclr' property but does not have software read access"
                 % (node.inst_name),
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
 
-class Prop_rset(PropertyRule):
+class Prop_rset(PropertyRuleBool):
     """
     Set on read (field = all 1’s).
     (9.6)
     """
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "P"
+    mutex_group = MutexGroup.P
 
     def get_default(self, node: m_node.Node) -> bool:
         """
@@ -824,10 +1013,10 @@ class Prop_rset(PropertyRule):
     def validate(self, node: m_node.Node, value: Any) -> None:
         assert isinstance(node, m_node.FieldNode)
         if value is True and not node.is_sw_readable:
-            self.env.msg.error(
+            node.env.msg.error(
                 "Field '%s' sets the 'rset' property but does not have software read access"
                 % (node.inst_name),
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
 
@@ -836,11 +1025,11 @@ class Prop_onread(PropertyRule):
     Read side-effect.
     (9.6)
     """
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (rdltypes.OnReadType,)
     default = None
     dyn_assign_allowed = True
-    mutex_group = "P"
+    mutex_group = MutexGroup.P
 
     def get_default(self, node: m_node.Node) -> Optional[rdltypes.OnReadType]:
         """
@@ -858,31 +1047,31 @@ class Prop_onread(PropertyRule):
         assert isinstance(node, m_node.FieldNode)
         # 9.6.1-i A field with an onread property shall have software read access
         if (value is not None) and not node.is_sw_readable:
-            self.env.msg.error(
+            node.env.msg.error(
                 "Field '%s' has an 'onread' property but does not have software read access"
                 % (node.inst_name),
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
         # 9.6.1-j A field with an onread value of ruser shall be external
         if (node.inst.external is False) and (value == rdltypes.OnReadType.ruser):
-            self.env.msg.error(
+            node.env.msg.error(
                 "The 'onread' property is set to 'ruser', but instance '%s' is not external"
                 % (node.inst_name),
                 node.inst.inst_src_ref
             )
 
 #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-class Prop_woclr(PropertyRule):
+class Prop_woclr(PropertyRuleBool):
     """
     Write one to clear (field = field & ~write_data).
     (9.6)
     """
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "B"
+    mutex_group = MutexGroup.B
 
     def get_default(self, node: m_node.Node) -> bool:
         """
@@ -897,23 +1086,23 @@ class Prop_woclr(PropertyRule):
     def validate(self, node: m_node.Node, value: Any) -> None:
         assert isinstance(node, m_node.FieldNode)
         if value is True and not node.is_sw_writable:
-            self.env.msg.error(
+            node.env.msg.error(
                 "Field '%s' sets the 'woclr' property but does not have software write access"
                 % (node.inst_name),
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
 
-class Prop_woset(PropertyRule):
+class Prop_woset(PropertyRuleBool):
     """
     Write one to set (field = field | write_data).
     (9.6)
     """
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "B"
+    mutex_group = MutexGroup.B
 
     def get_default(self, node: m_node.Node) -> bool:
         """
@@ -928,10 +1117,10 @@ class Prop_woset(PropertyRule):
     def validate(self, node: m_node.Node, value: Any) -> None:
         assert isinstance(node, m_node.FieldNode)
         if value is True and not node.is_sw_writable:
-            self.env.msg.error(
+            node.env.msg.error(
                 "Field '%s' sets the 'woset' property but does not have software write access"
                 % (node.inst_name),
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
 
@@ -940,11 +1129,11 @@ class Prop_onwrite(PropertyRule):
     Write side-effect
     (9.6)
     """
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (rdltypes.OnWriteType,)
     default = None
     dyn_assign_allowed = True
-    mutex_group = "B"
+    mutex_group = MutexGroup.B
 
     def get_default(self, node: m_node.Node) -> Optional[rdltypes.OnWriteType]:
         """
@@ -962,15 +1151,15 @@ class Prop_onwrite(PropertyRule):
         assert isinstance(node, m_node.FieldNode)
         # 9.6.1-l A field with an onwrite property shall have software write access.
         if (value is not None) and not node.is_sw_writable:
-            self.env.msg.error(
+            node.env.msg.error(
                 "Field '%s' has an 'onwrite' property but does not have software write access"
                 % (node.inst_name),
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
         # 9.6.1-m A field with an onwrite value of wuser shall be external
         if (node.inst.external is False) and (value == rdltypes.OnWriteType.wuser):
-            self.env.msg.error(
+            node.env.msg.error(
                 "The 'onwrite' property is set to 'wuser', but instance '%s' is not external"
                 % (node.inst_name),
                 node.inst.inst_src_ref
@@ -1014,16 +1203,16 @@ class Prop_swwe(PropertyRule):
     Field is writable if signal/field/value is True
     (9.6)
     """
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool, comp.Signal, comp.Field, rdltypes.PropertyReference,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "R"
+    mutex_group = MutexGroup.R
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         self._validate_ref_width_is_1(node, value)
         self._validate_ref_is_present(node, value)
-        _validate_swwe_writable(self.env, node, "swwe", value)
+        _validate_swwe_writable(node.env, node, "swwe", value)
 
 
 class Prop_swwel(PropertyRule):
@@ -1032,45 +1221,45 @@ class Prop_swwel(PropertyRule):
     Field is writable if signal/field/value is False
     (9.6)
     """
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool, comp.Signal, comp.Field, rdltypes.PropertyReference,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "R"
+    mutex_group = MutexGroup.R
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         self._validate_ref_width_is_1(node, value)
         self._validate_ref_is_present(node, value)
-        _validate_swwe_writable(self.env, node, "swwel", value)
+        _validate_swwe_writable(node.env, node, "swwel", value)
 
 #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-class Prop_swmod(PropertyRule):
+class Prop_swmod(PropertyRuleBool):
     """
     Indicates a generated output signal shall notify hardware when this field is
     modified by software
     (9.6)
     """
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
     mutex_group = None
 
 
-class Prop_swacc(PropertyRule):
+class Prop_swacc(PropertyRuleBool):
     """
     Indicates a generated output signal shall notify hardware when this field is
     accessed by software
     (9.6)
     """
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
     mutex_group = None
 
 
-class Prop_singlepulse(PropertyRule):
+class Prop_singlepulse(PropertyRuleBool):
     """
     Field asserts for one cycle when written 1 and then clears back to 0
     on the next cycle
@@ -1078,7 +1267,7 @@ class Prop_singlepulse(PropertyRule):
     shall be specified as 0
     (9.6)
     """
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
@@ -1090,24 +1279,24 @@ class Prop_singlepulse(PropertyRule):
         # and the reset value shall be specified as 0
         if value:
             if node.width != 1:
-                self.env.msg.error(
+                node.env.msg.error(
                     "Field '%s' marked as 'singlepulse' shall have width of 1"
                     % (node.inst_name),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
             if node.get_property('reset') != 0:
-                self.env.msg.error(
+                node.env.msg.error(
                     "Field '%s' marked as 'singlepulse' shall have a reset value of 0"
                     % (node.inst_name),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
             if not node.is_sw_writable:
-                self.env.msg.error(
+                node.env.msg.error(
                     "Field '%s' marked as 'singlepulse' shall be writable by software"
                     % (node.inst_name),
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
             # singlepulse does not make sense alongside any onwrite properties
@@ -1119,10 +1308,10 @@ class Prop_singlepulse(PropertyRule):
                     rdltypes.OnWriteType.wclr,
                 )
                 if onwrite in illegal_onwrite:
-                    self.env.msg.error(
+                    node.env.msg.error(
                         "Field '%s' marked as 'singlepulse' has conflicting 'onwrite' value of '%s'"
                         % (node.inst_name, onwrite.name),
-                        node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                        node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                     )
 
 #-------------------------------------------------------------------------------
@@ -1130,11 +1319,11 @@ class Prop_singlepulse(PropertyRule):
 #-------------------------------------------------------------------------------
 
 class Prop_we(PropertyRule):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool, comp.Signal, comp.Field, rdltypes.PropertyReference,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "C"
+    mutex_group = MutexGroup.C
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         assert isinstance(node, m_node.FieldNode)
@@ -1148,26 +1337,26 @@ class Prop_we(PropertyRule):
             uses_we = value
 
         if uses_we and (node.get_property('hw') not in (rdltypes.AccessType.rw, rdltypes.AccessType.w)):
-            self.env.msg.error(
+            node.env.msg.error(
                 "Field '%s' sets property 'we', but the field's 'hw' property indicates is not writable by hardware"
                 % (node.inst_name),
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
         if uses_we and not node.implements_storage:
-            self.env.msg.error(
+            node.env.msg.error(
                 "Use of 'we' property on field '%s' that does not implement storage does not make sense"
                 % (node.inst_name),
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
 
 class Prop_wel(PropertyRule):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool, comp.Signal, comp.Field, rdltypes.PropertyReference,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "C"
+    mutex_group = MutexGroup.C
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         assert isinstance(node, m_node.FieldNode)
@@ -1181,38 +1370,38 @@ class Prop_wel(PropertyRule):
             uses_we = value
 
         if uses_we and (node.get_property('hw') not in (rdltypes.AccessType.rw, rdltypes.AccessType.w)):
-            self.env.msg.error(
+            node.env.msg.error(
                 "Field '%s' sets property 'wel', but the field's 'hw' property indicates is not writable by hardware"
                 % (node.inst_name),
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
         if uses_we and not node.implements_storage:
-            self.env.msg.error(
+            node.env.msg.error(
                 "Use of 'wel' property on field '%s' that does not implement storage does not make sense"
                 % (node.inst_name),
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
 #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-class Prop_anded(PropertyRule):
-    bindable_to = {comp.Field}
+class Prop_anded(PropertyRuleBool):
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
     mutex_group = None
 
 
-class Prop_ored(PropertyRule):
-    bindable_to = {comp.Field}
+class Prop_ored(PropertyRuleBool):
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
     mutex_group = None
 
 
-class Prop_xored(PropertyRule):
-    bindable_to = {comp.Field}
+class Prop_xored(PropertyRuleBool):
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
@@ -1220,7 +1409,7 @@ class Prop_xored(PropertyRule):
 
 #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 class Prop_fieldwidth(PropertyRule):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (int,)
     default = None
     dyn_assign_allowed = False
@@ -1235,7 +1424,7 @@ class Prop_fieldwidth(PropertyRule):
 
 #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 class Prop_hwclr(PropertyRule):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool, comp.Signal, comp.Field, rdltypes.PropertyReference,)
     default = False
     dyn_assign_allowed = True
@@ -1247,7 +1436,7 @@ class Prop_hwclr(PropertyRule):
 
 
 class Prop_hwset(PropertyRule):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool, comp.Signal, comp.Field, rdltypes.PropertyReference,)
     default = False
     dyn_assign_allowed = True
@@ -1259,11 +1448,11 @@ class Prop_hwset(PropertyRule):
 
 #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 class Prop_hwenable(PropertyRule):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (comp.Field, comp.Signal, rdltypes.PropertyReference,)
     default = None
     dyn_assign_allowed = True
-    mutex_group = "D"
+    mutex_group = MutexGroup.D
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         assert isinstance(node, m_node.FieldNode)
@@ -1272,11 +1461,11 @@ class Prop_hwenable(PropertyRule):
 
 
 class Prop_hwmask(PropertyRule):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (comp.Field, comp.Signal, rdltypes.PropertyReference,)
     default = None
     dyn_assign_allowed = True
-    mutex_group = "D"
+    mutex_group = MutexGroup.D
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         assert isinstance(node, m_node.FieldNode)
@@ -1288,41 +1477,46 @@ class Prop_hwmask(PropertyRule):
 # Counter field properties
 #-------------------------------------------------------------------------------
 
-class Prop_counter(PropertyRule):
-    bindable_to = {comp.Field}
+class Prop_counter(PropertyRuleBool):
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "E"
+    mutex_group = MutexGroup.E
 
 
 class CounterProperty(PropertyRule):
+    __slots__ = ()
+
     def validate(self, node: m_node.Node, value: Any) -> None:
         # If using this property, validate that the field was marked as a counter
         if not node.get_property('counter'):
-            self.env.msg.error(
+            node.env.msg.error(
                 "Field '%s' uses property '%s' which is reserved for counter fields, but the field is not marked as a counter"
-                % (node.inst_name, self.get_name()),
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                % (node.inst_name, self._name),
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
 
-class Prop_threshold(CounterProperty):
+class CounterAliasProperty(CounterProperty):
     """
-    alias of incrthreshold.
+    Base class for the counter threshold/saturate properties, which come in
+    pairs of mutually-aliasing names. Assignments are mirrored onto the alias
+    counterpart.
     """
-    bindable_to = {comp.Field}
+    __slots__ = ()
+
+    bindable_to = frozenset({comp.Field})
     valid_types = (int, bool, comp.Signal, comp.Field, rdltypes.PropertyReference,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "incrthreshold alias"
 
-    def assign_value(self, comp_def: comp.Component, value: Any, src_ref: 'SourceRefBase') -> None:
+    def assign_value(self, env: 'RDLEnvironment', comp_def: comp.Component, value: Any, src_ref: 'SourceRefBase') -> None:
         """
         Set both alias and actual value
         """
-        super().assign_value(comp_def, value, src_ref)
-        comp_def.properties['incrthreshold'] = comp_def.properties['threshold']
+        super().assign_value(env, comp_def, value, src_ref)
+        comp_def.properties[self._alias_target] = comp_def.properties[self._name]
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         super().validate(node, value)
@@ -1331,74 +1525,34 @@ class Prop_threshold(CounterProperty):
         self._validate_ref_is_present(node, value)
 
 
-class Prop_saturate(CounterProperty):
+class Prop_threshold(CounterAliasProperty):
     """
-    alias of incrsaturate.
+    alias of incrthreshold.
     """
-    bindable_to = {comp.Field}
-    valid_types = (int, bool, comp.Signal, comp.Field, rdltypes.PropertyReference,)
-    default = False
-    dyn_assign_allowed = True
-    mutex_group = "incrsaturate alias"
+    mutex_group = MutexGroup.INCRTHRESHOLD_ALIAS
+    _alias_target = "incrthreshold"
 
-    def assign_value(self, comp_def: comp.Component, value: Any, src_ref: 'SourceRefBase') -> None:
-        """
-        Set both alias and actual value
-        """
-        super().assign_value(comp_def, value, src_ref)
-        comp_def.properties['incrsaturate'] = comp_def.properties['saturate']
 
-    def validate(self, node: m_node.Node, value: Any) -> None:
-        super().validate(node, value)
-        assert isinstance(node, m_node.FieldNode)
-        self._validate_ref_width(node, value)
-        self._validate_ref_is_present(node, value)
+class Prop_saturate(CounterAliasProperty):
+    """
+    alias of incrsaturate.
+    """
+    mutex_group = MutexGroup.INCRSATURATE_ALIAS
+    _alias_target = "incrsaturate"
 
 
-class Prop_incrthreshold(CounterProperty):
-    bindable_to = {comp.Field}
-    valid_types = (int, bool, comp.Signal, comp.Field, rdltypes.PropertyReference,)
-    default = False
-    dyn_assign_allowed = True
-    mutex_group = "incrthreshold alias"
+class Prop_incrthreshold(CounterAliasProperty):
+    mutex_group = MutexGroup.INCRTHRESHOLD_ALIAS
+    _alias_target = "threshold"
 
-    def assign_value(self, comp_def: comp.Component, value: Any, src_ref: 'SourceRefBase') -> None:
-        """
-        Set both alias and actual value
-        """
-        super().assign_value(comp_def, value, src_ref)
-        comp_def.properties['threshold'] = comp_def.properties['incrthreshold']
-
-    def validate(self, node: m_node.Node, value: Any) -> None:
-        super().validate(node, value)
-        assert isinstance(node, m_node.FieldNode)
-        self._validate_ref_width(node, value)
-        self._validate_ref_is_present(node, value)
 
-
-class Prop_incrsaturate(CounterProperty):
-    bindable_to = {comp.Field}
-    valid_types = (int, bool, comp.Signal, comp.Field, rdltypes.PropertyReference,)
-    default = False
-    dyn_assign_allowed = True
-    mutex_group = "incrsaturate alias"
-
-    def assign_value(self, comp_def: comp.Component, value: Any, src_ref: 'SourceRefBase') -> None:
-        """
-        Set both alias and actual value
-        """
-        super().assign_value(comp_def, value, src_ref)
-        comp_def.properties['saturate'] = comp_def.properties['incrsaturate']
-
-    def validate(self, node: m_node.Node, value: Any) -> None:
-        super().validate(node, value)
-        assert isinstance(node, m_node.FieldNode)
-        self._validate_ref_width(node, value)
-        self._validate_ref_is_present(node, value)
+class Prop_incrsaturate(CounterAliasProperty):
+    mutex_group = MutexGroup.INCRSATURATE_ALIAS
+    _alias_target = "saturate"
 
 
 class Prop_overflow(CounterProperty):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
@@ -1408,15 +1562,15 @@ class Prop_overflow(CounterProperty):
         super().validate(node, value)
 
         if node.get_property('incrsaturate') is not False:
-            self.env.msg.error(
+            node.env.msg.error(
                 "Use of 'overflow' property is meaningless. Counter sets the "
                 "'incrsaturate' property which makes it unable to overflow",
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
 
 class Prop_underflow(CounterProperty):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
@@ -1426,15 +1580,15 @@ class Prop_underflow(CounterProperty):
         super().validate(node, value)
 
         if node.get_property('decrsaturate') is not False:
-            self.env.msg.error(
+            node.env.msg.error(
                 "Use of 'underflow' property is meaningless. Counter sets the "
                 "'decrsaturate' property which makes it unable to underflow",
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
 
 class Prop_incr(CounterProperty):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (comp.Signal, comp.Field, rdltypes.PropertyReference,)
     default = None
     dyn_assign_allowed = True
@@ -1448,11 +1602,11 @@ class Prop_incr(CounterProperty):
 
 
 class Prop_incrvalue(CounterProperty):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (int, comp.Signal, comp.Field, rdltypes.PropertyReference,)
     default = None
     dyn_assign_allowed = True
-    mutex_group = "F"
+    mutex_group = MutexGroup.F
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         super().validate(node, value)
@@ -1470,30 +1624,30 @@ class Prop_incrvalue(CounterProperty):
 
 
 class Prop_incrwidth(CounterProperty):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (int,)
     default = None
     dyn_assign_allowed = True
-    mutex_group = "F"
+    mutex_group = MutexGroup.F
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         super().validate(node, value)
         assert isinstance(node, m_node.FieldNode)
 
         if not 1 <= value <= node.width:
-            self.env.msg.error(
+            node.env.msg.error(
                 "A counter's 'incrwidth' must be between 1 and the counter's width (%d)"
                 % node.width,
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
 
 class Prop_decrvalue(CounterProperty):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (int, comp.Signal, comp.Field, rdltypes.PropertyReference,)
     default = None
     dyn_assign_allowed = True
-    mutex_group = "G"
+    mutex_group = MutexGroup.G
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         super().validate(node, value)
@@ -1511,7 +1665,7 @@ class Prop_decrvalue(CounterProperty):
 
 
 class Prop_decr(CounterProperty):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (comp.Signal, comp.Field, rdltypes.PropertyReference,)
     default = None
     dyn_assign_allowed = True
@@ -1525,26 +1679,26 @@ class Prop_decr(CounterProperty):
 
 
 class Prop_decrwidth(CounterProperty):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (int,)
     default = None
     dyn_assign_allowed = True
-    mutex_group = "G"
+    mutex_group = MutexGroup.G
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         super().validate(node, value)
         assert isinstance(node, m_node.FieldNode)
 
         if not 1 <= value <= node.width:
-            self.env.msg.error(
+            node.env.msg.error(
                 "A counter's 'decrwidth' must be between 1 and the counter's width (%d)"
                 % node.width,
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
 
 class Prop_decrsaturate(CounterProperty):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (int, bool, comp.Signal, comp.Field, rdltypes.PropertyReference,)
     default = False
     dyn_assign_allowed = True
@@ -1558,7 +1712,7 @@ class Prop_decrsaturate(CounterProperty):
 
 
 class Prop_decrthreshold(PropertyRule):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (int, bool, comp.Signal, comp.Field, rdltypes.PropertyReference,)
     default = False
     dyn_assign_allowed = True
@@ -1574,16 +1728,16 @@ class Prop_decrthreshold(PropertyRule):
 # Field access interrupt properties
 #-------------------------------------------------------------------------------
 
-class Prop_intr(PropertyRule):
-    bindable_to = {comp.Field}
+class Prop_intr(PropertyRuleBool):
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "E"
+    mutex_group = MutexGroup.E
 
 
 class Prop_intr_type(PropertyRule):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (rdltypes.InterruptType,)
     default = None
     dyn_assign_allowed = True
@@ -1604,11 +1758,11 @@ class Prop_intr_type(PropertyRule):
 
 
 class Prop_enable(PropertyRule):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (comp.Field, comp.Signal,)
     default = None
     dyn_assign_allowed = True
-    mutex_group = "J"
+    mutex_group = MutexGroup.J
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         assert isinstance(node, m_node.FieldNode)
@@ -1617,18 +1771,18 @@ class Prop_enable(PropertyRule):
 
         if value:
             if not node.get_property('intr'):
-                self.env.msg.error(
+                node.env.msg.error(
                     "The 'enable' property can only be used on interrupt fields.",
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
 
 class Prop_mask(PropertyRule):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (comp.Field, comp.Signal, rdltypes.PropertyReference,)
     default = None
     dyn_assign_allowed = True
-    mutex_group = "J"
+    mutex_group = MutexGroup.J
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         assert isinstance(node, m_node.FieldNode)
@@ -1637,18 +1791,18 @@ class Prop_mask(PropertyRule):
 
         if value:
             if not node.get_property('intr'):
-                self.env.msg.error(
+                node.env.msg.error(
                     "The 'mask' property can only be used on interrupt fields.",
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
 
 class Prop_haltenable(PropertyRule):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (comp.Field, comp.Signal, rdltypes.PropertyReference,)
     default = None
     dyn_assign_allowed = True
-    mutex_group = "K"
+    mutex_group = MutexGroup.K
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         assert isinstance(node, m_node.FieldNode)
@@ -1657,18 +1811,18 @@ class Prop_haltenable(PropertyRule):
 
         if value:
             if not node.get_property('intr'):
-                self.env.msg.error(
+                node.env.msg.error(
                     "The 'haltenable' property can only be used on interrupt fields.",
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
 
 class Prop_haltmask(PropertyRule):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (comp.Field, comp.Signal, rdltypes.PropertyReference,)
     default = None
     dyn_assign_allowed = True
-    mutex_group = "K"
+    mutex_group = MutexGroup.K
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         assert isinstance(node, m_node.FieldNode)
@@ -1677,18 +1831,18 @@ class Prop_haltmask(PropertyRule):
 
         if value:
             if not node.get_property('intr'):
-                self.env.msg.error(
+                node.env.msg.error(
                     "The 'haltmask' property can only be used on interrupt fields.",
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
 
-class Prop_sticky(PropertyRule):
-    bindable_to = {comp.Field}
+class Prop_sticky(PropertyRuleBool):
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "I"
+    mutex_group = MutexGroup.I
 
     def validate(self, node: m_node.Node, value: Any) -> None:
         assert isinstance(node, m_node.FieldNode)
@@ -1700,17 +1854,17 @@ class Prop_sticky(PropertyRule):
                 rdltypes.InterruptType.negedge,
                 rdltypes.InterruptType.bothedge,
             }:
-                self.env.msg.error(
+                node.env.msg.error(
                     "Whole-field stickiness only makes sense in level-senstive interrupts, "
                     "but this field is defined as '%s intr'. "
                     "Did you mean to use the 'stickybit' property instead of 'sticky'?"
                     % intr_type.name,
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
             # Use of we/wel qualifier conflicts with sticky property
             if node.get_property('we'):
-                self.env.msg.error(
+                node.env.msg.error(
                     "Use of a hardware write-enable on field '%s' does not make "
                     "sense because it is defined as 'sticky'. Sticky fields already "
                     "implicitly control their hardware write-enable behavior based on the input value."
@@ -1718,7 +1872,7 @@ class Prop_sticky(PropertyRule):
                     node.inst.property_src_ref.get('we', node.inst.inst_src_ref)
                 )
             if node.get_property('wel'):
-                self.env.msg.error(
+                node.env.msg.error(
                     "Use of a hardware write-enable on field '%s' does not make "
                     "sense because it is defined as 'sticky'. Sticky fields already "
                     "implicitly control their hardware write-enable behavior based on the input value."
@@ -1727,20 +1881,20 @@ class Prop_sticky(PropertyRule):
                 )
 
             if not node.is_hw_writable:
-                self.env.msg.error(
+                node.env.msg.error(
                     "Sticky fields shall be hardware-writable",
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
 
 
 
-class Prop_stickybit(PropertyRule):
-    bindable_to = {comp.Field}
+class Prop_stickybit(PropertyRuleBool):
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = True
-    mutex_group = "I"
+    mutex_group = MutexGroup.I
 
     def get_default(self, node: m_node.Node) -> bool:
         """
@@ -1762,7 +1916,7 @@ class Prop_stickybit(PropertyRule):
         if value is True:
             # Use of we/wel qualifier conflicts with stickybit property
             if node.get_property('we'):
-                self.env.msg.error(
+                node.env.msg.error(
                     "Use of a hardware write-enable on field '%s' does not make "
                     "sense because it is defined as 'stickybit'. Stickybit fields already "
                     "implicitly control their hardware write-enable behavior based on the input value."
@@ -1770,7 +1924,7 @@ class Prop_stickybit(PropertyRule):
                     node.inst.property_src_ref.get('we', node.inst.inst_src_ref)
                 )
             if node.get_property('wel'):
-                self.env.msg.error(
+                node.env.msg.error(
                     "Use of a hardware write-enable on field '%s' does not make "
                     "sense because it is defined as 'stickybit'. Stickybit fields already "
                     "implicitly control their hardware write-enable behavior based on the input value."
@@ -1779,9 +1933,9 @@ class Prop_stickybit(PropertyRule):
                 )
 
             if not node.is_hw_writable:
-                self.env.msg.error(
+                node.env.msg.error(
                     "Stickybit fields shall be hardware-writable",
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
 
@@ -1789,7 +1943,7 @@ class Prop_stickybit(PropertyRule):
 # Misc properties
 #-------------------------------------------------------------------------------
 class Prop_encode(PropertyRule):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (rdltypes.UserEnum,)
     default = None
     dyn_assign_allowed = True
@@ -1800,23 +1954,23 @@ class Prop_encode(PropertyRule):
         # 9.10.1-b: The enumeration’s values shall fit inside the field width.
         enum_max = max(map(int, value))
         if enum_max >= (1 << node.width):
-            self.env.msg.error(
+            node.env.msg.error(
                 "Field '%s' is not wide enough to encode as enum '%s'"
                 % (node.inst_name, value.__name__),
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
 
 class Prop_precedence(PropertyRule):
-    bindable_to = {comp.Field}
+    bindable_to = frozenset({comp.Field})
     valid_types = (rdltypes.PrecedenceType,)
     default = rdltypes.PrecedenceType.sw
     dyn_assign_allowed = True
     mutex_group = None
 
 
-class Prop_paritycheck(PropertyRule):
-    bindable_to = {comp.Field}
+class Prop_paritycheck(PropertyRuleBool):
+    bindable_to = frozenset({comp.Field})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = False
@@ -1830,7 +1984,7 @@ class Prop_regwidth(PropertyRule):
     """
     The bit-width of the register (power of two).
     """
-    bindable_to = {comp.Reg}
+    bindable_to = frozenset({comp.Reg})
     valid_types = (int,)
     default = 32
     dyn_assign_allowed = False
@@ -1842,7 +1996,7 @@ class Prop_accesswidth(PropertyRule):
     The minimum software access width (power of two) operation that may be
     performed on the register.
     """
-    bindable_to = {comp.Reg}
+    bindable_to = frozenset({comp.Reg})
     valid_types = (int,)
     default = None
     dyn_assign_allowed = True
@@ -1859,15 +2013,15 @@ class Prop_accesswidth(PropertyRule):
         # 10.6.1-c: The value of the accesswidth property shall not exceed the
         # value of the regwidth property
         if value > node.get_property('regwidth'):
-            self.env.msg.error(
+            node.env.msg.error(
                 "Register '%s' has accesswidth of %d which exceeds its regwidth of %d"
                 % (node.inst_name, value, node.get_property('regwidth')),
-                node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
             )
 
 
-class Prop_shared(PropertyRule):
-    bindable_to = {comp.Reg}
+class Prop_shared(PropertyRuleBool):
+    bindable_to = frozenset({comp.Reg})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = False
@@ -1878,7 +2032,7 @@ class Prop_shared(PropertyRule):
 #===============================================================================
 
 class Prop_mementries(PropertyRule):
-    bindable_to = {comp.Mem}
+    bindable_to = frozenset({comp.Mem})
     valid_types = (int,)
     default = 1
     dyn_assign_allowed = False
@@ -1886,7 +2040,7 @@ class Prop_mementries(PropertyRule):
 
 
 class Prop_memwidth(PropertyRule):
-    bindable_to = {comp.Mem}
+    bindable_to = frozenset({comp.Mem})
     valid_types = (int,)
     default = 32
     dyn_assign_allowed = False
@@ -1897,7 +2051,7 @@ class Prop_memwidth(PropertyRule):
 #===============================================================================
 
 class Prop_alignment(PropertyRule):
-    bindable_to = {comp.Addrmap, comp.Regfile}
+    bindable_to = frozenset({comp.Addrmap, comp.Regfile})
     valid_types = (int,)
     default = None
     dyn_assign_allowed = False
@@ -1912,8 +2066,8 @@ class Prop_alignment(PropertyRule):
     # in order to distinguish it as unspecified by the user.
 
 
-class Prop_sharedextbus(PropertyRule):
-    bindable_to = {comp.Addrmap, comp.Regfile}
+class Prop_sharedextbus(PropertyRuleBool):
+    bindable_to = frozenset({comp.Addrmap, comp.Regfile})
     valid_types = (bool,)
     default = False
     dyn_assign_allowed = False
@@ -1923,77 +2077,64 @@ class Prop_sharedextbus(PropertyRule):
 # Address map properties
 #===============================================================================
 
-class Prop_bigendian(PropertyRuleBoolPair):
-    bindable_to = {comp.Addrmap}
-    valid_types = (bool,)
-    default = False # Default both to false unless one is explicitly set
-    dyn_assign_allowed = True
-    mutex_group = "L"
-
-    opposite_property = "littleendian"
-
-
-class Prop_littleendian(PropertyRuleBoolPair):
-    bindable_to = {comp.Addrmap}
-    valid_types = (bool,)
-    default = False # Default both to false unless one is explicitly set
-    dyn_assign_allowed = True
-    mutex_group = "L"
-
-    opposite_property = "bigendian"
-
-
+# Most of the addrmap boolean properties differ only in their configuration
+# literals, so their classes are generated from a table below instead of
+# hand-written bodies. The module-bottom pass registers them the same way.
+# Endianness and bit-order defaults are false unless the opposite is
+# explicitly set (see PropertyRuleBoolPair.get_default)
+# Shared by every addrmap property definition below - one object, not one
+# per class. (The module-bottom dedup pass would merge them anyway; sharing
+# at definition time just skips the redundant allocations)
+_ADDRMAP_ONLY = frozenset({comp.Addrmap})
+_VT_BOOL = (bool,)
+
+_ADDRMAP_BOOL_PROPS = (
+    # name, base, default, dyn_assign_allowed, mutex_group, opposite_property
+    ("bigendian",    PropertyRuleBoolPair, False, True,  MutexGroup.L, "littleendian"),
+    ("littleendian", PropertyRuleBoolPair, False, True,  MutexGroup.L, "bigendian"),
+    # rsvdset: read value of fields not explicitly defined is 1 if set, else 0
+    ("rsvdset",      PropertyRuleBool,     False, False, MutexGroup.Q, None),
+    ("rsvdsetX",     PropertyRuleBool,     False, False, MutexGroup.Q, None),
+    ("msb0",         PropertyRuleBoolPair, False, False, MutexGroup.M, "lsb0"),
+    ("lsb0",         PropertyRuleBoolPair, True,  False, MutexGroup.M, "msb0"),
+)
+
+for _name, _base, _default, _dyn_assign, _mutex, _opposite in _ADDRMAP_BOOL_PROPS:
+    _body = {
+        '__slots__': (),
+        'bindable_to': _ADDRMAP_ONLY,
+        'valid_types': _VT_BOOL,
+        'default': _default,
+        'dyn_assign_allowed': _dyn_assign,
+        'mutex_group': _mutex,
+    } # type: Dict[str, Any]
+    if _opposite is not None:
+        _body['opposite_property'] = _opposite
+    # Terminal configuration classes - mark final. The setup passes at module
+    # bottom still write precomputed attributes onto them, but once import
+    # completes the class dicts are never mutated again
+    globals()['Prop_' + _name] = final(type('Prop_' + _name, (_base,), _body))
+del _name, _base, _default, _dyn_assign, _mutex, _opposite, _body
+
+
+@final
 class Prop_addressing(PropertyRule):
-    bindable_to = {comp.Addrmap}
+    __slots__ = ()
+
+    bindable_to = _ADDRMAP_ONLY
     valid_types = (rdltypes.AddressingType,)
     default = rdltypes.AddressingType.regalign
     dyn_assign_allowed = False
     mutex_group = None
 
 
-class Prop_rsvdset(PropertyRule):
-    """
-    If true, the read value of all fields not explicitly defined is set to 1
-    otherwise, it is set to 0.
-    """
-    bindable_to = {comp.Addrmap}
-    valid_types = (bool,)
-    default = False
-    dyn_assign_allowed = False
-    mutex_group = "Q"
-
-
-class Prop_rsvdsetX(PropertyRule):
-    bindable_to = {comp.Addrmap}
-    valid_types = (bool,)
-    default = False
-    dyn_assign_allowed = False
-    mutex_group = "Q"
-
-
-class Prop_msb0(PropertyRuleBoolPair):
-    bindable_to = {comp.Addrmap}
-    valid_types = (bool,)
-    default = False
-    dyn_assign_allowed = False
-    mutex_group = "M"
-
-    opposite_property = "lsb0"
-
-
-class Prop_lsb0(PropertyRuleBoolPair):
-    bindable_to = {comp.Addrmap}
-    valid_types = (bool,)
-    default = True
-    dyn_assign_allowed = False
-    mutex_group = "M"
-
-    opposite_property = "msb0"
-
 #-------------------------------------------------------------------------------
-class Prop_bridge(PropertyRule):
-    bindable_to = {comp.Addrmap}
-    valid_types = (bool,)
+@final
+class Prop_bridge(PropertyRuleBool):
+    __slots__ = ()
+
+    bindable_to = _ADDRMAP_ONLY
+    valid_types = _VT_BOOL
     default = False
     dyn_assign_allowed = False
     mutex_group = None
@@ -2003,9 +2144,9 @@ class Prop_bridge(PropertyRule):
         if value:
             # is bridge
             if (node.parent is not None) and not isinstance(node.parent, m_node.RootNode):
-                self.env.msg.error(
+                node.env.msg.error(
                     "The 'bridge' property can only be applied to the root address map.",
-                    node.inst.property_src_ref.get(self.get_name(), node.inst.inst_src_ref)
+                    node.inst.property_src_ref.get(self._name, node.inst.inst_src_ref)
                 )
 
 #===============================================================================
@@ -2013,21 +2154,21 @@ class Prop_bridge(PropertyRule):
 #===============================================================================
 
 class UserProperty(PropertyRule):
-    def __init__(self, env, name, bindable_to, valid_types, default=None, constr_componentwidth=False):
-        # type: (RDLEnvironment, str, Set[Type[comp.Component]], Iterable[Any], Any, bool) -> None
-        super().__init__(env)
-
-        self.name = name
-        self.bindable_to = bindable_to
-        self.valid_types = valid_types
+    def __init__(self, name, bindable_to, valid_types, default=None, constr_componentwidth=False):
+        # type: (str, Set[Type[comp.Component]], Iterable[Any], Any, bool) -> None
+        self.name = sys.intern(name)
+        self._name = self.name
+        # Normalize to the same container types the built-in rules use:
+        # callers may pass lists/sets, but the assignment hot path expects a
+        # frozenset membership probe and a fixed iteration order
+        self.bindable_to = frozenset(bindable_to)
+        self.valid_types = tuple(valid_types)
+        self._cast_map = _build_cast_map(self.valid_types)
         self.default = default
         self.constr_componentwidth = constr_componentwidth
 
-    def get_name(self) -> str:
-        return self.name
-
 
-    def assign_value(self, comp_def: comp.Component, value: Any, src_ref: 'SourceRefBase') -> None:
+    def assign_value(self, env: 'RDLEnvironment', comp_def: comp.Component, value: Any, src_ref: 'SourceRefBase') -> None:
         # Property assignments with no rhs show up as None here
         # For user-defined properties, this implies the default value
         # (15.2.2)
@@ -2039,7 +2180,7 @@ class UserProperty(PropertyRule):
 
             value = self.default
 
-        super().assign_value(comp_def, value, src_ref)
+        super().assign_value(env, comp_def, value, src_ref)
 
     def get_default(self, node: m_node.Node) -> Any:
         # pylint: disable=unused-argument
@@ -2058,7 +2199,7 @@ class UserProperty(PropertyRule):
             # non-vector nodes
             if isinstance(node, m_node.VectorNode):
                 if value >= (1 << node.width):
-                    self.env.msg.error(
+                    node.env.msg.error(
                         "Value (%d) of the '%s' property cannot fit within the width (%d) of component '%s'"
                         % (value, self.name, node.width, node.inst_name),
                         node.inst.property_src_ref.get(self.name, node.inst.inst_src_ref)
@@ -2500,28 +2641,36 @@ class PropertyRuleBook:
     def __init__(self, env: 'RDLEnvironment'):
         self.env = env
 
-        # Auto-discover all properties defined below and load into dict
-        self.rdl_properties = {} # type: Dict[str, PropertyRule]
-        for prop in get_all_subclasses(PropertyRule):
-            if prop.__name__.startswith("Prop_"):
-                prop_inst = prop(self.env)
-                self.rdl_properties[prop_inst.get_name()] = prop(self.env)
+        # Built-in rules are stateless singletons shared by every compiler,
+        # instantiated lazily on first lookup
+        self.rdl_properties = _RDL_RULES # type: Dict[str, Union[PropertyRule, Type[PropertyRule]]]
 
         self.user_properties = {} # type: Dict[str, UserProperty]
 
+        # Merged view of rdl_properties and user_properties so that
+        # lookup_property() is a single dict probe.
+        # Kept up to date by _add_udp()
+        self._all_properties = dict(self.rdl_properties) # type: Dict[str, Union[PropertyRule, Type[PropertyRule]]]
+
+        # Precomputed index of built-in property names per component type,
+        # for "list all valid properties" queries
+        self.rdl_prop_names_by_type = PROP_NAMES_BY_COMP_TYPE # type: Dict[Type[comp.Component], Tuple[str, ...]]
+
         self.rdl_prop_refs = {} # type: Dict[str, Type[rdltypes.PropertyReference]]
-        for prop_ref in get_all_subclasses(rdltypes.PropertyReference):
+        for prop_ref in _collect_subclasses(rdltypes.PropertyReference):
             if prop_ref.__name__.startswith("PropRef_"):
                 prop_name = prop_ref.get_name()
                 self.rdl_prop_refs[prop_name] = prop_ref
 
     def lookup_property(self, prop_name: str) -> Optional[PropertyRule]:
-        if prop_name in self.rdl_properties:
-            return self.rdl_properties[prop_name]
-        elif prop_name in self.user_properties:
-            return self.user_properties[prop_name]
-        else:
-            return None
+        rule = self._all_properties.get(prop_name)
+        if isinstance(rule, type):
+            # Built-in rule that has not been instantiated yet.
+            # Build it now and publish the instance for later lookups
+            rule = rule()
+            _RDL_RULES[prop_name] = rule
+            self._all_properties[prop_name] = rule
+        return rule
 
     def lookup_prop_ref_type(self, prop_ref_name):
         # type: (str) -> Optional[Type[rdltypes.PropertyReference]]
@@ -2542,14 +2691,95 @@ class PropertyRuleBook:
                 src_ref
             )
 
-        self.user_properties[udp.name] = udp
-
+        self._add_udp(udp)
 
-# Dictionary of mutex group names --> set of property names that belong to the mutex
-MUTEX_PROP_GROUPS = {} # type: Dict[str, Set[str]]
-for prop_cls in get_all_subclasses(PropertyRule):
-    if prop_cls.__name__.startswith("Prop_"):
-        if prop_cls.mutex_group is not None:
-            if prop_cls.mutex_group not in MUTEX_PROP_GROUPS:
-                MUTEX_PROP_GROUPS[prop_cls.mutex_group] = set()
-            MUTEX_PROP_GROUPS[prop_cls.mutex_group].add(prop_cls.get_name_cls())
+    def _add_udp(self, udp: UserProperty) -> None:
+        self.user_properties[udp.name] = udp
+        self._all_properties[udp.name] = udp
+
+
+def _init_rule_classes() -> None:
+    """
+    Per-class bookkeeping for every rule class: cached/interned property name,
+    registry entry, precomputed cast map and method-override flags.
+    An explicit pass rather than an __init_subclass__ hook, since PEP 487
+    requires Python 3.6 and this package still supports 3.5
+    """
+    for rule_cls in _collect_subclasses(PropertyRule):
+        # Cache the property name so that assignment/query hot paths do not
+        # re-derive it from the class name every time.
+        # get_name_cls() may be overridden by subclasses.
+        # The name is interned since it is used as a dict key on every
+        # property store/query - lookups with an interned key short-circuit
+        # on pointer identity
+        rule_cls._name = sys.intern(rule_cls.get_name_cls())
+
+        if 'opposite_property' in rule_cls.__dict__:
+            rule_cls.opposite_property = sys.intern(rule_cls.opposite_property)
+
+        if rule_cls.__dict__.get('_alias_target'):
+            rule_cls._alias_target = sys.intern(rule_cls._alias_target)
+
+        if rule_cls.__name__.startswith("Prop_"):
+            PropertyRule._registry[rule_cls._name] = rule_cls
+
+        # Precompute cast compatibility for common assignment types
+        rule_cls._cast_map = _build_cast_map(rule_cls.valid_types)
+
+        # Check against the base implementation rather than cls.__dict__ so
+        # that overrides inherited from an intermediate class still count
+        rule_cls._has_custom_default = rule_cls.get_default is not PropertyRule.get_default
+        rule_cls._has_validate = rule_cls.validate is not PropertyRule.validate
+
+_init_rule_classes()
+
+
+# Built-in property rules are stateless, so one instance of each can be
+# shared by every PropertyRuleBook/compiler.
+# Rules are instantiated lazily: entries start out as the rule class and are
+# replaced by the singleton instance the first time the rule is looked up.
+# A typical compilation only ever touches a fraction of the ~90 rules
+_RDL_RULES = dict(PropertyRule._registry) # type: Dict[str, Union[PropertyRule, Type[PropertyRule]]]
+
+
+# Many rules declare identical bindable_to/valid_types signatures.
+# Collapse each distinct signature down to one shared object
+_shared_bindings = {} # type: Dict[FrozenSet[Type[comp.Component]], FrozenSet[Type[comp.Component]]]
+_shared_valid_types = {} # type: Dict[Tuple[Any, ...], Tuple[Any, ...]]
+for prop_cls in PropertyRule._registry.values():
+    if 'bindable_to' in prop_cls.__dict__:
+        prop_cls.bindable_to = _shared_bindings.setdefault(prop_cls.bindable_to, prop_cls.bindable_to)
+    if 'valid_types' in prop_cls.__dict__:
+        prop_cls.valid_types = _shared_valid_types.setdefault(prop_cls.valid_types, prop_cls.valid_types)
+del _shared_bindings
+del _shared_valid_types
+
+
+# Built-in property names valid for each component type, in registration
+# order. "List all properties" queries index this instead of filtering the
+# full rulebook per call
+PROP_NAMES_BY_COMP_TYPE = {} # type: Dict[Type[comp.Component], Tuple[str, ...]]
+for _comp_t in (comp.Addrmap, comp.Regfile, comp.Reg, comp.Field, comp.Mem, comp.Signal):
+    PROP_NAMES_BY_COMP_TYPE[_comp_t] = tuple(
+        name for name, prop_cls in PropertyRule._registry.items()
+        if _comp_t in prop_cls.bindable_to
+    )
+del _comp_t
+
+
+# Dictionary of mutex groups --> set of property names that belong to the mutex
+MUTEX_PROP_GROUPS = {} # type: Dict[MutexGroup, Set[str]]
+for prop_cls in PropertyRule._registry.values():
+    if prop_cls.mutex_group is not None:
+        if prop_cls.mutex_group not in MUTEX_PROP_GROUPS:
+            MUTEX_PROP_GROUPS[prop_cls.mutex_group] = set()
+        MUTEX_PROP_GROUPS[prop_cls.mutex_group].add(prop_cls._name)
+
+# Give each grouped rule a ready-to-iterate tuple of the other members of its
+# mutex group, so assignments skip the group-dict lookup entirely
+for prop_cls in PropertyRule._registry.values():
+    if prop_cls.mutex_group is not None:
+        prop_cls._mutex_peers = tuple(
+            name for name in MUTEX_PROP_GROUPS[prop_cls.mutex_group]
+            if name != prop_cls._name
+        )
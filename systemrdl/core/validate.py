@@ -41,7 +41,8 @@ class ValidateListener(walker.RDLListener):
                 prop_value._validate()
 
             prop_rule = self.env.property_rules.lookup_property(prop_name)
-            prop_rule.validate(node, prop_value)
+            if prop_rule._has_validate:
+                prop_rule.validate(node, prop_value)
 
         if not isinstance(node, SignalNode):
             self.has_cpuif_reset_stack.append(False)
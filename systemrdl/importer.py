@@ -309,7 +309,7 @@ class RDLImporter:
             # Warn user that this is not how references work
             raise TypeError("Invalid assignment type")
         src_ref = src_ref or self.default_src_ref
-        rule.assign_value(component, value, src_ref)
+        rule.assign_value(self.compiler.env, component, value, src_ref)
 
     def register_root_component(self, definition: comp.Component) -> None:
         """
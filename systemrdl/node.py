@@ -411,8 +411,12 @@ class Node:
         if type(self.inst) not in rule.bindable_to:
             raise LookupError("Unknown property '%s'" % prop_name)
 
-        # Return the default value as specified by the rulebook
-        return rule.get_default(self)
+        # Return the default value as specified by the rulebook.
+        # Most rules' defaults are plain constants - skip the method call
+        # unless the rule actually derives its default
+        if rule._has_custom_default:
+            return rule.get_default(self)
+        return rule.default
 
 
     def list_properties(self, list_all: bool=False, include_native: bool=True, include_udp: bool=True) -> List[str]:
@@ -436,11 +440,11 @@ class Node:
         """
 
         if list_all:
-            props = []
+            props = [] # type: List[str]
             if include_native:
-                for k, v in self.env.property_rules.rdl_properties.items():
-                    if type(self.inst) in v.bindable_to:
-                        props.append(k)
+                # Valid built-in names per component type are precomputed -
+                # no need to filter the whole rulebook here
+                props.extend(self.env.property_rules.rdl_prop_names_by_type.get(type(self.inst), ()))
             if include_udp:
                 for k, v in self.env.property_rules.user_properties.items():
                     if type(self.inst) in v.bindable_to:
@@ -665,16 +665,45 @@ class ArrayPlaceholder():
     Once elaborated, arrays are converted to Python lists
     In the meantime, this placeholder is used to communicate expected type
     information during compilation type checking
+
+    Placeholders for builtin scalar element types are interned, so the common
+    placeholders that compare equal are also the same object
     """
+
+    # Cache of placeholder instances, keyed by (class, element type).
+    # Only builtin scalar element types are cached: user-defined enum/struct
+    # classes are created per compilation, and pinning them here would keep
+    # them (and everything they reference) alive for the life of the process
+    _instances = {} # type: Dict[Any, 'ArrayPlaceholder']
+    _INTERNABLE_ELEMENT_TYPES = frozenset({int, bool, str, None})
+
+    def __new__(cls, element_type: PreElabRDLType) -> 'ArrayPlaceholder':
+        if element_type not in cls._INTERNABLE_ELEMENT_TYPES:
+            return super().__new__(cls)
+        inst = cls._instances.get((cls, element_type))
+        if inst is None:
+            inst = super().__new__(cls)
+            cls._instances[(cls, element_type)] = inst
+        return inst
+
     def __init__(self, element_type: PreElabRDLType):
         self.element_type = element_type
 
+    def __getnewargs__(self) -> Tuple[Any, ...]:
+        # Route copies/pickles through __new__'s interning cache
+        return (self.element_type,)
+
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, ArrayPlaceholder):
             return self.element_type == other.element_type
         else:
             return NotImplemented
 
+    def __hash__(self) -> int:
+        # __eq__ compares element_type across any ArrayPlaceholder instances,
+        # so subclass instances must hash the same as base ones
+        return hash((ArrayPlaceholder, self.element_type))
+
 #===============================================================================
 def get_rdltype(value: Any) -> PreElabRDLType:
     """